@@ -26,6 +26,10 @@ font = pygame.font.Font(None, FONT_SIZE)
 # Goal state for comparison [1, 2, 3, 4, 5, 6, 7, 8, 0]
 goal_state = list(range(1, ROWS * COLS)) + [0] 
 
+# Diagonal symmetry: transposing the board and relabeling tiles maps the goal onto itself
+MIRROR_POS = [(i % COLS) * ROWS + i // COLS for i in range(ROWS * COLS)]
+MIRROR_TILE = {tile: goal_state[MIRROR_POS[goal_state.index(tile)]] for tile in goal_state}
+
 # Helper Functions
 def manhattan_distance(state):
     distance = 0
@@ -54,14 +58,41 @@ def valid_moves(empty_pos):
     if col < COLS - 1: moves.append(empty_pos + 1)  # move right
     return moves
 
+def mirror_state(state):
+    mirrored = [0] * len(state)
+    for i, tile in enumerate(state):
+        mirrored[MIRROR_POS[i]] = MIRROR_TILE[tile]
+    return tuple(mirrored)
+
+def canonical_state(state):
+    # Mirrored boards are equally far from the goal, so search one of each pair
+    state = tuple(state)
+    if ROWS != COLS: return state  # no diagonal symmetry on rectangular boards
+    return min(state, mirror_state(state))
+
+def unfold_path(start_state, canonical_path):
+    # Replay canonical states as real boards reachable from start_state
+    path = [tuple(start_state)]
+    for target in canonical_path[1:]:
+        current_state = path[-1]
+        empty_pos = current_state.index(0)
+        for move in valid_moves(empty_pos):
+            new_state = list(current_state)
+            new_state[empty_pos], new_state[move] = new_state[move], new_state[empty_pos]
+            if canonical_state(new_state) == target:
+                path.append(tuple(new_state))
+                break
+    return path
+
 def solve_puzzle_astar(start_state):
+    start = canonical_state(start_state)
     open_list = []
     closed_list = set()
     parent_map = {}
-    g_cost = {tuple(start_state): 0}
-    f_cost = {tuple(start_state): manhattan_distance(start_state)}
+    g_cost = {start: 0}
+    f_cost = {start: manhattan_distance(start)}
 
-    heapq.heappush(open_list, (f_cost[tuple(start_state)], tuple(start_state)))
+    heapq.heappush(open_list, (f_cost[start], start))
 
     while open_list:
         _, current_state = heapq.heappop(open_list)
@@ -71,8 +102,8 @@ def solve_puzzle_astar(start_state):
             while current_state in parent_map:
                 path.append(current_state)
                 current_state = parent_map[current_state]
-            path.append(tuple(start_state))
-            return path[::-1]
+            path.append(start)
+            return unfold_path(start_state, path[::-1])
 
         closed_list.add(current_state)
 
@@ -80,7 +111,7 @@ def solve_puzzle_astar(start_state):
         for move in valid_moves(empty_pos):
             new_state = list(current_state)
             new_state[empty_pos], new_state[move] = new_state[move], new_state[empty_pos]
-            new_state_tuple = tuple(new_state)
+            new_state_tuple = canonical_state(new_state)
             if new_state_tuple in closed_list:
                 continue
 
@@ -95,13 +126,14 @@ def solve_puzzle_astar(start_state):
     return None  # No solution found
 
 def solve_puzzle_bfs(start_state):
+    start = canonical_state(start_state)
     queue = deque()
     visited = set()
     parent_map = {}
     
-    queue.append(tuple(start_state))
-    visited.add(tuple(start_state))
-    parent_map[tuple(start_state)] = None
+    queue.append(start)
+    visited.add(start)
+    parent_map[start] = None
     
     while queue:
         current_state = queue.popleft()
@@ -111,14 +143,14 @@ def solve_puzzle_bfs(start_state):
             while current_state in parent_map and parent_map[current_state] is not None:
                 path.append(current_state)
                 current_state = parent_map[current_state]
-            path.append(tuple(start_state))
-            return path[::-1]
+            path.append(start)
+            return unfold_path(start_state, path[::-1])
         
         empty_pos = current_state.index(0)
         for move in valid_moves(empty_pos):
             new_state = list(current_state)
             new_state[empty_pos], new_state[move] = new_state[move], new_state[empty_pos]
-            new_state_tuple = tuple(new_state)
+            new_state_tuple = canonical_state(new_state)
             
             if new_state_tuple not in visited:
                 visited.add(new_state_tuple)
@@ -45,6 +45,10 @@ font_small = pygame.font.Font(None, 40)
 # Goal state
 goal_state = list(range(1, ROWS * COLS)) + [0]
 
+# Diagonal symmetry: transposing the board and relabeling tiles maps the goal onto itself
+MIRROR_POS = [(i % COLS) * ROWS + i // COLS for i in range(ROWS * COLS)]
+MIRROR_TILE = {tile: goal_state[MIRROR_POS[goal_state.index(tile)]] for tile in goal_state}
+
 # ===== GAME FUNCTIONS =====
 def is_solvable(puzzle):
     """Check if puzzle is solvable by counting inversions"""
@@ -65,6 +69,33 @@ def valid_moves(empty_pos):
     if col < COLS - 1: moves.append(empty_pos + 1)  # Right
     return moves
 
+def mirror_state(state):
+    """Reflect a state about the main diagonal, relabeling tiles to keep the goal fixed"""
+    mirrored = [0] * len(state)
+    for i, tile in enumerate(state):
+        mirrored[MIRROR_POS[i]] = MIRROR_TILE[tile]
+    return tuple(mirrored)
+
+def canonical_state(state):
+    """Map a state to the representative of its symmetry class"""
+    state = tuple(state)
+    if ROWS != COLS: return state  # No diagonal symmetry on rectangular boards
+    return min(state, mirror_state(state))
+
+def unfold_path(start_state, canonical_path):
+    """Turn a path of canonical states back into real boards starting from start_state"""
+    path = [tuple(start_state)]
+    for target in canonical_path[1:]:
+        current = path[-1]
+        empty_pos = current.index(0)
+        for move in valid_moves(empty_pos):
+            new_state = list(current)
+            new_state[empty_pos], new_state[move] = new_state[move], new_state[empty_pos]
+            if canonical_state(new_state) == target:
+                path.append(tuple(new_state))
+                break
+    return path
+
 def manhattan_distance(state):
     """Calculate Manhattan distance heuristic"""
     distance = 0
@@ -77,11 +108,12 @@ def manhattan_distance(state):
     return distance
 
 def solve_puzzle_astar(start_state):
-    """Solve using A* algorithm with Manhattan distance"""
+    """Solve using A* algorithm with Manhattan distance over symmetry classes"""
+    start = canonical_state(start_state)
     open_set = []
-    heapq.heappush(open_set, (manhattan_distance(start_state), tuple(start_state)))
+    heapq.heappush(open_set, (manhattan_distance(start), start))
     came_from = {}
-    g_score = {tuple(start_state): 0}
+    g_score = {start: 0}
     
     while open_set:
         _, current = heapq.heappop(open_set)
@@ -91,14 +123,14 @@ def solve_puzzle_astar(start_state):
             while current in came_from:
                 path.append(current)
                 current = came_from[current]
-            path.append(tuple(start_state))
-            return path[::-1]
+            path.append(start)
+            return unfold_path(start_state, path[::-1])
         
         empty_pos = current.index(0)
         for move in valid_moves(empty_pos):
             new_state = list(current)
             new_state[empty_pos], new_state[move] = new_state[move], new_state[empty_pos]
-            new_state_tuple = tuple(new_state)
+            new_state_tuple = canonical_state(new_state)
             
             tentative_g = g_score[current] + 1
             if new_state_tuple not in g_score or tentative_g < g_score[new_state_tuple]:
@@ -110,9 +142,10 @@ def solve_puzzle_astar(start_state):
     return None
 
 def solve_puzzle_bfs(start_state):
-    """Solve using BFS algorithm"""
-    queue = deque([tuple(start_state)])
-    visited = {tuple(start_state): None}
+    """Solve using BFS algorithm over symmetry classes"""
+    start = canonical_state(start_state)
+    queue = deque([start])
+    visited = {start: None}
     
     while queue:
         current = queue.popleft()
@@ -122,13 +155,13 @@ def solve_puzzle_bfs(start_state):
             while current in visited:
                 path.append(current)
                 current = visited[current]
-            return path[::-1]
+            return unfold_path(start_state, path[::-1])
         
         empty_pos = current.index(0)
         for move in valid_moves(empty_pos):
             new_state = list(current)
             new_state[empty_pos], new_state[move] = new_state[move], new_state[empty_pos]
-            new_state_tuple = tuple(new_state)
+            new_state_tuple = canonical_state(new_state)
             
             if new_state_tuple not in visited:
                 visited[new_state_tuple] = current